@@ -4,7 +4,7 @@ from typing import List, Type
 
 from dotenv import load_dotenv
 import os
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.engine import Engine
@@ -74,6 +74,37 @@ def check_tables(conn, tables: List[Type]) -> List[str]:
     return missing_tables
 
 
+def ensure_extensions():
+    """创建依赖的数据库扩展（pg_trgm 用于模糊搜索的三元组索引）"""
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except Exception as e:
+        logging.warning(f"create extension pg_trgm failed: {str(e)}")
+
+
+_indexes_ensured = False
+
+
+def ensure_indexes(tables: List[Type]):
+    """为模型声明的 __trgm_columns__ 创建三元组索引（每个进程只执行一次）"""
+    global _indexes_ensured
+    if _indexes_ensured:
+        return
+    ensure_extensions()
+    for model in tables:
+        table = model.__tablename__
+        for column in getattr(model, '__trgm_columns__', ()):
+            name = f"idx_{table}_{column}_trgm"
+            try:
+                # 每个索引单独事务，失败只记录警告，避免影响其他索引和表
+                with engine.begin() as conn:
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)"))
+            except Exception as e:
+                logging.warning(f"create index {name} failed: {str(e)}")
+    _indexes_ensured = True
+
+
 def init_db():
     """初始化数据库（只创建不存在的表）"""
     try:
@@ -96,6 +127,8 @@ def check_db():
             if missing_tables:
                 logging.info(f"missing tables: {', '.join(missing_tables)}, creating...")
                 init_db()
+        # 补建三元组索引
+        ensure_indexes(get_all_models())
     except Exception as e:
         logging.error(f"database check failed: {str(e)}")
         raise e
\ No newline at end of file
@@ -18,6 +18,9 @@ class Stock(Base):
         UniqueConstraint( 'code', name='uix_stock_code'),
         Index('idx_stock_code', 'code'),
     )
+    # 关键字模糊搜索(ILIKE '%xx%')使用的三元组索引列，依赖 pg_trgm 扩展
+    # 不放入 __table_args__，避免扩展不可用时 create_all 整体回滚，由 ensure_indexes 单独创建
+    __trgm_columns__ = ('code', 'name', 'pinyin')
     # 基础信息
     id = Column(BigInteger, primary_key=True, index=True)
     removed = Column(Boolean, default=False)
@@ -0,0 +1,100 @@
+"""
+布林带策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, HDR_PARAMS, to_html, pros_cons, render_page
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "波动性"), ("适用周期", "日/周线"), ("难度等级", "⭐⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            布林带（Bollinger Bands）由John Bollinger在**1980年代**发明，是基于**统计学标准差**的动态通道指标
+
+            **核心思想**：价格围绕均值波动，当偏离过大时会回归。通道宽度随波动性自动调整
+
+            **计算公式**：
+            - **中轨** = N日简单移动平均线（SMA）
+            - **上轨** = 中轨 + K × N日标准差
+            - **下轨** = 中轨 - K × N日标准差
+
+            **默认参数**：N=20，K=2
+
+
+            **统计意义**：价格有95%的概率在上下轨之间波动（假设正态分布）
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号
+                **条件**：
+                1. 价格**跌破下轨**后**反弹**
+                2. **强买入**：反弹幅度 > 2%
+
+                **原理**：价格超跌，均值回归
+                """,
+            """
+                #### 🔴 卖出信号
+                **条件**：
+                1. 价格**突破上轨**后**回落**
+                2. **强卖出**：回落幅度 > 2%
+
+                **原理**：价格超涨，均值回归
+                """,
+        ),
+        pros_cons(
+            """
+                - 动态调整，适应市场波动变化
+                - 结合了价格和波动性两个维度
+                - 特别适合波段交易
+                - 可以识别超买超卖和趋势
+                - 直观易懂，视觉化好
+                """,
+            """
+                - 强趋势中通道会持续扩张
+                - 触及轨道不一定反转
+                - 需要结合其他指标确认
+                - 横盘时信号较少
+                """,
+        ),
+        HDR_PARAMS,
+        md("""
+            | 参数 | 默认值 | 说明 |
+            |------|--------|------|
+            | period | 20 | 中轨周期 |
+            | std_dev | 2.0 | 标准差倍数 |
+
+            **参数调整**：
+            - 通道太窄：增大std_dev（如2.5）
+            - 通道太宽：减小std_dev（如1.5）
+            - 更灵敏：减小period（如10）
+            - 更平滑：增大period（如30）
+            """),
+    )
+    tips = md("""
+        1. **通道收窄**：布林带变窄（Squeeze）预示即将出现大行情
+        2. **通道扩张**：布林带变宽预示波动加剧
+        3. **中轨作用**：
+           - 上升趋势：价格常在中轨上方运行
+           - 下降趋势：价格常在中轨下方运行
+           - 中轨可作为支撑/压力位
+        4. **骑墙走**：价格沿着上轨或下轨运行，说明趋势很强
+        5. **W底和M顶**：
+           - 价格两次触及下轨形成W底 → 买入
+           - 价格两次触及上轨形成M顶 → 卖出
+        6. **配合RSI**：触及下轨且RSI<30，买入信号更可靠
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
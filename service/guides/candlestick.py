@@ -0,0 +1,354 @@
+"""
+蜡烛图策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, header, metric_row, two_col, HDR_PRINCIPLE, HDR_PARAMS, to_html, render_page
+
+
+# 信号示例，按形态分段
+_SIGNAL_EXAMPLE_PARTS = (
+    md("""
+        ### 看涨吞没形态示例
+
+        **场景**：某股票连续下跌后
+
+        **K线表现**：
+        - Day 1: 开盘100，收盘95，最高101，最低94（阴线）
+        - Day 2: 开盘94，收盘103，最高104，最低93（阳线）
+
+        **形态特征**：
+        - Day 2开盘价(94) < Day 1收盘价(95) ✓
+        - Day 2收盘价(103) > Day 1开盘价(100) ✓
+        - Day 2完全吞没Day 1 ✓
+
+        **信号判断**：**强烈买入信号** ⭐⭐⭐⭐⭐
+
+        **交易策略**：
+        - 入场：Day 2收盘或Day 3开盘买入
+        - 止损：设在Day 2最低点93以下
+        - 目标：根据风险收益比设定（至少1:2）
+        """),
+    md("""
+        ### 黄昏星形态示例
+
+        **场景**：某股票上涨一段时间后
+
+        **K线表现**：
+        - Day 1: 开盘100，收盘108，最高109，最低99（大阳线）
+        - Day 2: 开盘110，收盘111，最高112，最低109（小阳线/十字星）
+        - Day 3: 开盘109，收盘102，最高110，最低101（大阴线）
+
+        **形态特征**：
+        - Day 1是大阳线 ✓
+        - Day 2实体小，有跳空 ✓
+        - Day 3是大阴线，收盘在Day 1实体中部以下 ✓
+
+        **信号判断**：**强烈卖出信号** ⭐⭐⭐⭐⭐
+
+        **交易策略**：
+        - 出场：Day 3收盘或Day 4开盘卖出
+        - 止损：如果持有空单，设在Day 2最高点112以上
+        - 目标：根据风险收益比设定
+        """),
+)
+
+
+# 历史与发展，按小节分段
+_HISTORY_PARTS = (
+    md("""
+        ### 🏛️ 起源历史
+
+        **发明者**：本间宗久（Homma Munehisa，1724-1803）
+
+        **时间地点**：18世纪日本大阪的米市交易所
+
+        **历史背景**：
+        - 本间宗久是日本酒田地区的米商
+        - 通过研究米价波动规律，发明了蜡烛图
+        - 据说他连续100次交易无一失手
+        - 被誉为"酒田战法"
+        """),
+    md("""
+        ### 🌏 传播发展
+
+        **1. 日本时期（18-19世纪）**
+        - 在日本商品交易中广泛使用
+        - 形成了完整的理论体系
+
+        **2. 现代复兴（1990年代）**
+        - 1991年，Steve Nison出版《日本蜡烛图技术》
+        - 将蜡烛图系统介绍给西方
+        - 迅速成为全球交易员必备工具
+
+        **3. 当代应用（2000年至今）**
+        - 结合计算机技术，实现自动识别
+        - 与现代技术指标结合使用
+        - 应用于股票、期货、外汇、数字货币等所有市场
+        """),
+    md("""
+        ### 📖 经典著作
+
+        1. **《日本蜡烛图技术》** - Steve Nison（1991）
+           - 蜡烛图技术的圣经
+           - 系统介绍各种形态及应用
+
+        2. **《蜡烛图方法：从入门到精通》** - Stephen Bigalow（2001）
+           - 实战导向，适合初学者
+           - 包含大量实例分析
+
+        3. **《酒田战法》** - 日本经典（原著年代不详）
+           - 本间宗久的原始理论
+           - 日本蜡烛图的理论基础
+        """),
+    md("""
+        ### 🎓 学习建议
+
+        1. **理论学习**（1-2周）
+           - 掌握各种形态的定义和特征
+           - 理解形态背后的市场心理
+
+        2. **识别训练**（1-2个月）
+           - 在历史图表中寻找形态
+           - 记录每种形态的出现频率
+
+        3. **模拟交易**（2-3个月）
+           - 根据形态信号进行模拟交易
+           - 统计成功率和盈亏比
+
+        4. **实战应用**（持续学习）
+           - 小仓位实战，积累经验
+           - 不断总结和优化策略
+           - 形成自己的交易系统
+        """),
+)
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "形态识别"), ("适用周期", "日/周/月线"), ("难度等级", "⭐⭐⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            ### 什么是蜡烛图（K线图）？
+
+            蜡烛图源于18世纪日本米市交易，是由一位叫本间宗久的米商发明。它通过绘制开盘价、收盘价、最高价和最低价四个价格，
+            形成类似蜡烛的图形，因此得名。
+
+            **K线组成部分**：
+            - **实体（Body）**：开盘价和收盘价之间的矩形区域
+            - **上影线（Upper Shadow）**：实体上方到最高价的线段
+            - **下影线（Lower Shadow）**：实体下方到最低价的线段
+
+            **颜色含义**：
+            - **阳线（红色/白色）**：收盘价 > 开盘价，表示上涨
+            - **阴线（绿色/黑色）**：收盘价 < 开盘价，表示下跌
+
+            ### 形态识别原理
+
+            通过识别特定的K线组合形态，可以预测价格的反转或延续趋势。本策略实现了15+种经典形态识别。
+            """),
+        header("📊", "形态分类"),
+        md("""
+            ### 1. 单K线反转形态
+            """),
+        two_col(
+            """
+                **🔨 锤子线（Hammer）** - 强烈看涨
+                - 特征：下影线长（≥2倍实体），上影线短
+                - 出现位置：下跌趋势末端
+                - 信号强度：★★★★☆
+                - 含义：价格探底回升，多方开始反击
+
+                **🔻 倒锤子线（Inverted Hammer）** - 看涨
+                - 特征：上影线长（≥2倍实体），下影线短
+                - 出现位置：下跌趋势末端
+                - 信号强度：★★★☆☆
+                - 含义：买方试探性上攻，需确认
+                """,
+            """
+                **☄️ 流星线（Shooting Star）** - 强烈看跌
+                - 特征：上影线长（≥2倍实体），下影线短
+                - 出现位置：上涨趋势顶部
+                - 信号强度：★★★★☆
+                - 含义：价格冲高回落，卖压沉重
+
+                **🔺 上吊线（Hanging Man）** - 看跌
+                - 特征：下影线长（≥2倍实体），上影线短
+                - 出现位置：上涨趋势顶部
+                - 信号强度：★★★☆☆
+                - 含义：获利盘涌出，需要警惕
+                """,
+        ),
+        md("""
+            **➕ 十字星（Doji）** - 趋势转折
+            - 特征：开盘价 ≈ 收盘价（实体极小）
+            - 出现位置：任何趋势中
+            - 信号强度：★★☆☆☆
+            - 含义：多空力量均衡，趋势可能反转
+            """),
+        md("""
+            ### 2. 双K线组合形态
+            """),
+        two_col(
+            """
+                **📈 看涨吞没（Bullish Engulfing）**
+                - 形态：第一根阴线 + 第二根大阳线完全吞没第一根
+                - 出现位置：下跌趋势
+                - 信号强度：★★★★★
+                - 交易建议：强烈买入信号，可积极建仓
+
+                **🌅 刺透形态（Piercing Pattern）**
+                - 形态：大阴线 + 阳线收盘在前一根实体中部以上
+                - 出现位置：下跌趋势
+                - 信号强度：★★★★☆
+                - 交易建议：看涨信号，可考虑买入
+                """,
+            """
+                **📉 看跌吞没（Bearish Engulfing）**
+                - 形态：第一根阳线 + 第二根大阴线完全吞没第一根
+                - 出现位置：上涨趋势
+                - 信号强度：★★★★★
+                - 交易建议：强烈卖出信号，应及时止盈
+
+                **☁️ 乌云盖顶（Dark Cloud Cover）**
+                - 形态：大阳线 + 阴线收盘在前一根实体中部以下
+                - 出现位置：上涨趋势
+                - 信号强度：★★★★☆
+                - 交易建议：看跌信号，可考虑卖出
+                """,
+        ),
+        md("""
+            ### 3. 三K线组合形态
+            """),
+        two_col(
+            """
+                **🌟 晨星（Morning Star）**
+                - 形态：大阴线 + 小实体 + 大阳线
+                - 出现位置：下跌趋势末端
+                - 信号强度：★★★★★
+                - 交易建议：黎明来临，强烈买入
+
+                **⚔️ 三只白兵（Three White Soldiers）**
+                - 形态：连续三根阳线，收盘价递增
+                - 出现位置：下跌趋势或盘整后
+                - 信号强度：★★★★★
+                - 交易建议：多头强势，可追涨
+                """,
+            """
+                **⭐ 黄昏星（Evening Star）**
+                - 形态：大阳线 + 小实体 + 大阴线
+                - 出现位置：上涨趋势顶部
+                - 信号强度：★★★★★
+                - 交易建议：黄昏降临，强烈卖出
+
+                **🦅 三只乌鸦（Three Black Crows）**
+                - 形态：连续三根阴线，收盘价递减
+                - 出现位置：上涨趋势或盘整后
+                - 信号强度：★★★★★
+                - 交易建议：空头强势，应止损离场
+                """,
+        ),
+        HDR_PARAMS,
+        md("""
+            | 参数名称 | 默认值 | 参数含义 | 调整方向 |
+            |---------|-------|---------|---------|
+            | body_min_ratio | 0.6 | 实体最小比例（相对总长度），用于识别大实体K线 | 提高→要求实体更大，形态更标准 |
+            | shadow_ratio | 2.0 | 影线比例阈值（相对实体），用于识别长影线 | 提高→要求影线更长，形态更极端 |
+            | trend_ma_period | 20 | 趋势判断MA周期，用于判断当前趋势方向 | 增加→趋势判断更平滑，减少→更敏感 |
+            """),
+    )
+    pros_cons = two_col(
+        """
+            ### ✅ 优点
+
+            1. **直观易懂**
+               - 图形化展示，容易识别和记忆
+               - 不需要复杂的数学计算
+
+            2. **历史悠久**
+               - 300年实战验证
+               - 全球交易员广泛使用
+
+            3. **即时反应**
+               - 实时反映市场情绪
+               - 可以快速做出交易决策
+
+            4. **适用性广**
+               - 适用于所有金融市场
+               - 不受时间周期限制
+
+            5. **可组合使用**
+               - 可与技术指标结合
+               - 提高信号准确性
+            """,
+        """
+            ### ❌ 缺点
+
+            1. **主观性强**
+               - 形态识别存在个人判断差异
+               - 需要经验积累
+
+            2. **假信号多**
+               - 震荡市场中容易出现假信号
+               - 需要其他指标确认
+
+            3. **滞后性**
+               - 形态完成后才能确认
+               - 可能错过最佳入场点
+
+            4. **需要确认**
+               - 单一形态可靠性有限
+               - 最好等待下一根K线确认
+
+            5. **学习曲线**
+               - 形态众多，需要时间掌握
+               - 实战经验很重要
+            """,
+    )
+    tips = md("""
+        ### 🎯 最佳实践
+
+        1. **确认趋势**
+           - 在明确的趋势中，形态信号更可靠
+           - 使用移动平均线等指标辅助判断趋势
+
+        2. **成交量配合**
+           - 反转形态出现时，成交量应放大
+           - 成交量确认可以提高信号可靠性
+
+        3. **等待确认**
+           - 不要在形态未完成时就交易
+           - 最好等待下一根K线确认形态
+
+        4. **结合其他指标**
+           - 配合RSI、MACD等技术指标
+           - 在支撑位/阻力位出现的形态更有效
+
+        5. **风险控制**
+           - 设置止损位（形态最低/最高点）
+           - 控制仓位，不要满仓操作
+
+        ### ⚠️ 注意事项
+
+        - **盘整期谨慎**：在横盘整理期间，形态信号可靠性降低
+        - **单一形态不足**：不要仅依赖单一形态做决策
+        - **时间周期选择**：日线和周线的形态比分钟线更可靠
+        - **市场环境**：牛市中看涨形态效果更好，熊市中看跌形态效果更好
+        - **假突破警惕**：特别是在重要支撑/阻力位附近
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("⚖️ 优缺点分析", to_html(pros_cons)),
+        ("💡 实用建议", to_html(tips)),
+        ("📝 信号示例", to_html(join(*_SIGNAL_EXAMPLE_PARTS))),
+        ("📚 历史与发展", to_html(join(*_HISTORY_PARTS))),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    """蜡烛图策略详情页"""
+    render_page(*_render())
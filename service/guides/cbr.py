@@ -0,0 +1,120 @@
+"""
+CBR策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, to_html, render_page, pros_cons
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "反转策略"), ("适用周期", "周/月线"), ("难度等级", "⭐⭐⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            CBR（Confirmation-Based Reversal）是一种**基于价格形态和MACD确认的反转策略**
+
+            **核心思想**：通过观察连续3天的K线形态变化，结合MACD指标确认，捕捉趋势反转的机会
+
+            **时间窗口**：
+            - **T-2**：前天
+            - **T-1**：昨天
+            - **T**：今天
+
+            **双重确认机制**：
+            1. 价格形态确认（K线相对位置变化）
+            2. MACD指标确认（金叉/死叉）
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号（反转向上）
+                **条件1（价格回落）**：
+                - T-2的最高价 > T-1的最高价
+                - T-2的最低价 > T-1的最低价
+
+                **条件2（突破确认）**：
+                - T的收盘价 > T-1的最高价
+                **或** MACD金叉
+
+                **原理**：价格先回落再突破，反转信号
+                """,
+            """
+                #### 🔴 卖出信号（反转向下）
+                **条件1（价格上涨）**：
+                - T-2的最高价 < T-1的最高价
+                - T-2的最低价 < T-1的最低价
+
+                **条件2（跌破确认）**：
+                - T的收盘价 < T-1的最低价
+                **或** MACD死叉
+
+                **原理**：价格先上涨再跌破，反转信号
+                """,
+        ),
+        pros_cons(
+            """
+                - 捕捉反转机会，买在相对低点
+                - 双重确认降低虚假信号
+                - 适合震荡市和反转行情
+                - 结合形态和指标，更可靠
+                """,
+            """
+                - 需要更长时间框架（至少3天）
+                - 信号较少，等待时间长
+                - 趋势市场中表现不佳
+                - 判断较复杂，需要经验
+                """,
+        ),
+    )
+    tips = md("""
+        1. **最佳时机**：
+           - 下跌趋势末期的反转向上
+           - 上涨趋势末期的反转向下
+
+        2. **结合趋势**：
+           - 在长期上升趋势中，只做买入信号
+           - 在长期下降趋势中，只做卖出信号
+
+        3. **止损设置**：
+           - 买入后：跌破T-1的最低价止损
+           - 卖出后：突破T-1的最高价止损
+
+        4. **周期选择**：
+           - 日线：信号多但准确度较低
+           - 周线：信号少但质量高（推荐）
+           - 月线：信号非常少，适合长线
+
+        5. **配合成交量**：
+           - 反转信号伴随放量更可靠
+           - 缩量反转需谨慎对待
+        """)
+    example = md("""
+        ```
+        买入示例：
+        T-2: 最高102, 最低98  (前天，较高位置)
+        T-1: 最高100, 最低96  (昨天，回落)
+        T:   收盘101          (今天，收盘突破昨日最高100)
+
+        → 满足条件：回落后突破，买入信号！
+
+        卖出示例：
+        T-2: 最高98,  最低94  (前天，较低位置)
+        T-1: 最高102, 最低98  (昨天，上涨)
+        T:   收盘97           (今天，收盘跌破昨日最低98)
+
+        → 满足条件：上涨后跌破，卖出信号！
+        ```
+        """)
+    # 实战技巧和信号示例放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+        ("📈 信号示例", to_html(example)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
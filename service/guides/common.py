@@ -0,0 +1,77 @@
+"""
+策略详情页公共的 markdown/HTML 拼接函数
+"""
+import textwrap
+
+import streamlit as st
+from markdown_it import MarkdownIt
+
+# 分隔线
+DIVIDER = "---"
+
+# 与 Streamlit 一致的 GFM 子集（表格、删除线），允许内嵌 HTML
+_MARKDOWN = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+
+# 小节标题模板
+_HEADER_TMPL = '<div class="chart-header"><span class="chart-icon">{icon}</span><span class="chart-title">{title}</span></div>'
+
+# 指标卡片模板
+_METRIC_TMPL = (
+    '<div class="metric-sub-card metric-card-{n}">'
+    '<div class="metric-label">{label}</div>'
+    '<div class="metric-value">{value}</div>'
+    '</div>'
+)
+
+
+def md(text: str) -> str:
+    """去掉三引号字符串的公共缩进，避免被解析为代码块"""
+    return textwrap.dedent(text).strip()
+
+
+def to_html(text: str) -> str:
+    """在服务端把 markdown 转成 HTML（用 st.html 输出），前端不必再解析 markdown"""
+    return f'<div class="strategy-doc">{_MARKDOWN.render(text)}</div>'
+
+
+def render_page(body: str, collapsed: tuple[tuple[str, str], ...] = ()):
+    """输出详情页正文，collapsed 中篇幅较长的 (标题, HTML) 小节放在默认收起的折叠面板中"""
+    st.html(body)
+    for label, html in collapsed:
+        with st.expander(label, expanded=False):
+            st.html(html)
+
+
+def join(*parts: str) -> str:
+    """用空行连接各段，保证 HTML 块与 markdown 段落互不干扰"""
+    return "\n\n".join(parts)
+
+
+def header(icon: str, title: str) -> str:
+    return _HEADER_TMPL.format(icon=icon, title=title)
+
+
+def metric_row(*cards: tuple[str, str]) -> str:
+    """顶部指标卡片行，cards 为 (标签, 值)"""
+    items = "".join(
+        _METRIC_TMPL.format(n=n, label=label, value=value)
+        for n, (label, value) in enumerate(cards, start=1)
+    )
+    return f'<div class="strategy-metric-row">{items}</div>'
+
+
+def two_col(left: str, right: str) -> str:
+    """两列布局，列内仍按 markdown 解析（HTML 标签与内容之间需要空行）"""
+    return f'<div class="strategy-grid-2">\n<div>\n\n{md(left)}\n\n</div>\n<div>\n\n{md(right)}\n\n</div>\n</div>'
+
+
+def pros_cons(pros: str, cons: str) -> str:
+    """优缺点小节：标题 + 左优点右缺点两列"""
+    return join(HDR_PROS_CONS, two_col(f"**✅ 优点**\n{md(pros)}", f"**❌ 缺点**\n{md(cons)}"))
+
+
+# 各详情页通用的小节标题
+HDR_PRINCIPLE = header("📖", "策略原理")
+HDR_SIGNALS = header("🎯", "交易信号")
+HDR_PARAMS = header("⚙️", "参数说明")
+HDR_PROS_CONS = header("⚖️", "优缺点")
@@ -0,0 +1,115 @@
+"""
+KDJ策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, HDR_PARAMS, to_html, pros_cons, render_page
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "超买超卖"), ("适用周期", "日/周线"), ("难度等级", "⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            KDJ指标由George Lane在**1950年代**发明，又称**随机指标**（Stochastic Oscillator）
+
+            **核心思想**：比较收盘价在最近一段时间内最高最低价区间的相对位置。上涨时收盘价趋向最高价，下跌时趋向最低价
+
+            **计算公式**：
+            ```
+            RSV = (收盘价 - N日内最低价) / (N日内最高价 - N日内最低价) × 100
+            K值 = RSV的M1日移动平均
+            D值 = K值的M2日移动平均
+            J值 = 3K - 2D
+            ```
+
+            **默认参数**：N=9, M1=3, M2=3
+
+            **取值范围**：0-100（J值可能超出）
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号（金叉）
+                **条件**：
+                1. **K线上穿D线**（金叉）
+                2. **强买入**：K和D都在20以下（深度超卖区）
+
+                **原理**：超卖反弹，做多信号
+                """,
+            """
+                #### 🔴 卖出信号（死叉）
+                **条件**：
+                1. **K线下穿D线**（死叉）
+                2. **强卖出**：K和D都在80以上（深度超买区）
+
+                **原理**：超买回落，做空信号
+                """,
+        ),
+        pros_cons(
+            """
+                - 灵敏度高，反应迅速
+                - 适合短线和波段交易
+                - J值领先指标，提前预警
+                - 超买超卖判断准确
+                - 中国股市使用广泛
+                """,
+            """
+                - 震荡市场信号过多
+                - 强趋势中会产生虚假信号
+                - 需要频繁交易
+                - 参数敏感
+                """,
+        ),
+        HDR_PARAMS,
+        md("""
+            | 参数 | 默认值 | 说明 |
+            |------|--------|------|
+            | n | 9 | RSV计算周期 |
+            | m1 | 3 | K值平滑参数 |
+            | m2 | 3 | D值平滑参数 |
+            | oversold | 20 | 超卖线 |
+            | overbought | 80 | 超买线 |
+
+            **参数调整**：
+            - 短线：(5, 3, 3) - 更灵敏
+            - 中线：(9, 3, 3) - 标准设置
+            - 长线：(14, 5, 5) - 更平滑
+            """),
+    )
+    tips = md("""
+        1. **KDJ金叉死叉**：
+           - 20以下金叉 → 强买入（超卖反弹）
+           - 80以上死叉 → 强卖出（超买回落）
+           - 50附近交叉 → 信号较弱，谨慎对待
+
+        2. **J值应用**：
+           - J值>100：严重超买，警惕回调
+           - J值<0：严重超卖，可能反弹
+           - J值领先K值和D值，可提前预警
+
+        3. **钝化现象**：
+           - 强势股：KDJ可能长期在高位钝化（>80）
+           - 弱势股：KDJ可能长期在低位钝化（<20）
+           - 钝化时不要盲目反向操作
+
+        4. **背离信号**：
+           - 价格创新高，KDJ不创新高 → 顶背离
+           - 价格创新低，KDJ不创新低 → 底背离
+
+        5. **配合趋势**：
+           - 上升趋势：关注低位金叉
+           - 下降趋势：关注高位死叉
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
@@ -0,0 +1,108 @@
+"""
+MACD策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, HDR_PARAMS, to_html, pros_cons, render_page
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "趋势跟踪"), ("适用周期", "日/周/月线"), ("难度等级", "⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            MACD（Moving Average Convergence Divergence）由Gerald Appel在1970年代发明
+
+            **最经典的技术指标之一**
+
+            **核心思想**：通过快慢两条移动平均线的差值变化来判断趋势的强弱和转折点
+
+            **计算公式**：
+            - **DIFF（快线）** = 12日EMA - 26日EMA
+            - **DEA（慢线）** = DIFF的9日EMA
+            - **MACD柱** = (DIFF - DEA) × 2
+
+            其中EMA是指数移动平均线（Exponential Moving Average）
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号（金叉）
+                1. **DIFF上穿DEA**（金叉出现）
+                2. **DIFF > 0**（零轴上方，趋势向上）
+                3. **强买入**：DIFF上升角度>30°
+
+                **示例**：
+                - DIFF从-0.5上升到0.2并穿过DEA
+                - 此时DIFF>0，为强买入信号
+                """,
+            """
+                #### 🔴 卖出信号（死叉）
+                1. **DIFF下穿DEA**（死叉出现）
+                2. **强卖出**：DIFF<0且DEA<0（双双进入负值区）
+
+                **示例**：
+                - DIFF从0.3下降到-0.1并跌破DEA
+                - DIFF和DEA都小于0，为强卖出信号
+                """,
+        ),
+        pros_cons(
+            """
+                - 趋势跟踪能力强，适合捕捉中长期趋势
+                - 信号明确，容易判断（金叉买入，死叉卖出）
+                - 适合趋势明显的市场
+                - 过滤了价格的短期波动
+                - 应用广泛，被大量交易者认可
+                """,
+            """
+                - 震荡市场会产生虚假信号
+                - 存在一定的滞后性（基于移动平均）
+                - 横盘整理时表现不佳
+                - 需要结合其他指标确认
+                """,
+        ),
+        HDR_PARAMS,
+        md("""
+            | 参数 | 默认值 | 说明 |
+            |------|--------|------|
+            | 快线周期 | 12 | 短期EMA的计算周期 |
+            | 慢线周期 | 26 | 长期EMA的计算周期 |
+            | 信号周期 | 9 | DEA线的平滑周期 |
+
+            **调参建议**：
+            - 短线交易：可使用(6, 13, 5)
+            - 长线交易：可使用(19, 39, 9)
+            - **不建议**频繁调整参数，容易过度优化
+            """),
+    )
+    tips = md("""
+        1. **结合趋势使用**：在明确的上升或下降趋势中使用效果最好
+        2. **零轴判断**：DIFF在零轴上方金叉更可靠，在零轴下方死叉更可靠
+        3. **柱状图辅助**：MACD柱状图由负转正可提前预示金叉
+        4. **背离信号**：价格创新高但MACD不创新高（顶背离），可能见顶
+        5. **组合使用**：建议与成交量、趋势线等配合使用
+        """)
+    example = md("""
+        ```
+        日期       收盘价    DIFF    DEA     信号
+        01-10     100.0    -0.3    -0.2     -
+        01-11     102.0    -0.1    -0.15    -
+        01-12     105.0     0.2     0.05    🟢 买入（金叉+零轴上方）
+        01-13     108.0     0.4     0.2     持有
+        01-14     106.0     0.3     0.25    持有
+        01-15     103.0     0.1     0.2     🔴 卖出（死叉）
+        ```
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+        ("📈 信号示例", to_html(example)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
@@ -0,0 +1,101 @@
+"""
+RSI策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, HDR_PARAMS, to_html, pros_cons, render_page
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "超买超卖"), ("适用周期", "日/周线"), ("难度等级", "⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            RSI（Relative Strength Index）由Welles Wilder在**1978年**发明
+
+            是衡量价格变动速度和幅度的**动量震荡指标**
+
+            **核心思想**：通过比较一段时期内价格上涨幅度和下跌幅度的平均值来衡量买卖力量的强弱
+
+            **计算公式**：
+            ```
+            RS = 平均涨幅 / 平均跌幅
+            RSI = 100 - (100 / (1 + RS))
+            ```
+
+            **取值范围**：0-100
+            - **>70**：超买区（Overbought），可能回调
+            - **<30**：超卖区（Oversold），可能反弹
+            - **50**：中性区
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号
+                **条件**：
+                1. RSI **从超卖区（<30）向上穿越**
+                2. **强买入**：RSI急速上升（单日变化>5）
+
+                **原理**：超卖后反弹，抄底机会
+                """,
+            """
+                #### 🔴 卖出信号
+                **条件**：
+                1. RSI **从超买区（>70）向下穿越**
+                2. **强卖出**：RSI急速下降（单日变化>5）
+
+                **原理**：超买后回调，获利了结
+                """,
+        ),
+        pros_cons(
+            """
+                - 反应灵敏，适合短线交易
+                - 超买超卖判断准确
+                - 特别适合震荡市场
+                - 可以提前预警价格反转
+                - 应用广泛，成熟可靠
+                """,
+            """
+                - 强趋势中会过早退出
+                - 可能长时间处于超买/超卖区
+                - 需要结合趋势判断
+                - 参数敏感，需要调优
+                """,
+        ),
+        HDR_PARAMS,
+        md("""
+            | 参数 | 默认值 | 说明 |
+            |------|--------|------|
+            | period | 14 | 计算周期 |
+            | oversold | 30 | 超卖线 |
+            | overbought | 70 | 超买线 |
+
+            **常用设置**：
+            - 短线：(6, 20, 80) - 更灵敏
+            - 中线：(14, 30, 70) - 标准设置
+            - 长线：(21, 35, 65) - 更平滑
+            """),
+    )
+    tips = md("""
+        1. **趋势配合**：在上升趋势中，RSI常在40-90区间波动；下降趋势中在10-60区间
+        2. **背离信号**：
+           - 价格创新高但RSI不创新高 → 顶背离，警惕下跌
+           - 价格创新低但RSI不创新低 → 底背离，可能反弹
+        3. **区间修正**：
+           - 强势股：超买线70→80，超卖线30→40
+           - 弱势股：超买线70→60，超卖线30→20
+        4. **中线穿越**：RSI上穿50线确认上升趋势，下穿50线确认下降趋势
+        5. **钝化现象**：强趋势中RSI可能持续在超买/超卖区，不要盲目反向操作
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
@@ -0,0 +1,75 @@
+"""
+SMA策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, to_html, pros_cons, render_page
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "趋势跟踪"), ("适用周期", "日/周/月线"), ("难度等级", "⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            SMA（Simple Moving Average）是**最简单也最经典**的技术分析工具
+
+            **核心思想**：短期均线代表短期趋势，长期均线代表长期趋势。当短期均线上穿长期均线时，表示短期趋势转强，产生买入信号
+
+            **本系统使用的均线**：
+            - **MA5**：5日移动平均线（短期趋势）
+            - **MA10**：10日移动平均线（中短期趋势）
+            - **MA30**：30日移动平均线（中期趋势）
+            - **MA250**：250日移动平均线（年线，长期趋势）
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号（金叉）
+                **条件**：
+                1. **MA5上穿MA10**
+                2. **MACD DIFF > 0** 且 **DEA > 0**（趋势确认）
+
+                这种双重确认可以**降低虚假信号**
+                """,
+            """
+                #### 🔴 卖出信号（死叉）
+                **条件**：
+                1. **MA10下破MA5**
+                2. 为强卖出信号
+
+                **特点**：简单直接，容易执行
+                """,
+        ),
+        pros_cons(
+            """
+                - 非常简单，新手易于理解和使用
+                - 信号明确，不需要复杂判断
+                - 多时间框架验证（短中长期均线）
+                - 适合趋势明显的市场
+                """,
+            """
+                - 滞后性较强（毕竟是移动平均）
+                - 震荡市场频繁产生虚假信号
+                - 可能错过趋势初期的最佳入场点
+                """,
+        ),
+    )
+    tips = md("""
+        1. **多头排列**：MA5 > MA10 > MA30 > MA250，强势上涨趋势
+        2. **空头排列**：MA5 < MA10 < MA30 < MA250，强势下跌趋势
+        3. **年线支撑**：MA250常作为重要的支撑/压力位
+        4. **均线粘合**：多条均线靠得很近时，往往预示即将变盘
+        5. **配合成交量**：金叉时放量更可靠
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
@@ -0,0 +1,115 @@
+"""
+海龟策略详情页
+"""
+import streamlit as st
+
+from service.guides.common import DIVIDER, md, join, metric_row, two_col, HDR_PRINCIPLE, HDR_SIGNALS, HDR_PARAMS, to_html, pros_cons, render_page
+
+
+@st.cache_resource(show_spinner=False)
+def _render() -> tuple[str, tuple[tuple[str, str], ...]]:
+    """返回页面正文和折叠显示的 (标题, HTML) 小节"""
+    body = join(
+        metric_row(("策略类型", "突破系统"), ("适用周期", "周/月线"), ("难度等级", "⭐⭐⭐")),
+        DIVIDER,
+        HDR_PRINCIPLE,
+        md("""
+            海龟交易法则源自**1980年代**著名的"海龟交易实验", Richard Dennis和William Eckhardt通过训练新手证明交易可以被教授
+
+            **核心思想**：基于唐奇安通道（Donchian Channels）的突破系统。当价格突破近期最高/最低价时，说明趋势可能形成
+
+            **通道计算**：
+            - **上轨** = 过去N天的最高价
+            - **下轨** = 过去N天的最低价
+
+            **ATR（平均真实波幅）**：
+            ```
+            TR = max(最高价-最低价, |最高价-昨收|, |最低价-昨收|)
+            ATR = TR的N日移动平均
+            ```
+
+            ATR用于衡量市场波动性和信号强度。
+            """),
+        HDR_SIGNALS,
+        two_col(
+            """
+                #### 🟢 买入信号（突破）
+                **入场条件**：
+                1. 收盘价**突破20日上轨**
+                2. **强买入**：突破幅度 ≥ 0.5倍ATR
+
+                **原理**：突破新高，趋势形成
+                """,
+            """
+                #### 🔴 卖出信号（回落）
+                **出场条件**：
+                1. 多头**回落至10日下轨**
+                2. 止损退出
+
+                **原理**：跌破近期低点，趋势结束
+                """,
+        ),
+        pros_cons(
+            """
+                - 经过实战验证的经典策略
+                - 趋势跟踪能力极强
+                - 风险控制明确（ATR止损）
+                - 适合长线交易
+                - 可应用于多个市场
+                """,
+            """
+                - 震荡市场频繁止损
+                - 需要较长的观察周期
+                - 入场较晚（确认突破后）
+                - 胜率相对较低（约40-50%）
+                - 需要严格纪律执行
+                """,
+        ),
+        HDR_PARAMS,
+        md("""
+            | 参数 | 默认值 | 说明 |
+            |------|--------|------|
+            | entry_window | 20 | 入场通道周期 |
+            | exit_window | 10 | 出场通道周期 |
+            | atr_period | 20 | ATR计算周期 |
+
+            **经典组合**：
+            - 激进：(20, 10, 20)
+            - 保守：(55, 20, 20)
+            - 超短：(10, 5, 14)
+            """),
+    )
+    tips = md("""
+        1. **原版海龟法则**：
+           - 入场：突破20日最高价
+           - 加仓：每上涨0.5ATR加仓一次（最多4次）
+           - 止损：跌破2ATR止损
+           - 出场：跌破10日最低价
+
+        2. **通道选择**：
+           - 系统1：20日通道入场，10日通道出场（激进）
+           - 系统2：55日通道入场，20日通道出场（保守）
+
+        3. **资金管理**：
+           - 每次交易风险不超过账户的1-2%
+           - 使用ATR计算仓位大小
+
+        4. **市场选择**：
+           - 最适合趋势明显的商品期货市场
+           - 股票市场中选择强势股
+           - 避免长期横盘的标的
+
+        5. **心理准备**：
+           - 接受连续止损（可能5-8次）
+           - 耐心等待大趋势
+           - 一次大趋势的盈利可以覆盖多次小亏损
+        """)
+    # 篇幅较长的小节放在折叠面板中
+    collapsed = (
+        ("💡 实战技巧", to_html(tips)),
+    )
+    return to_html(body), collapsed
+
+
+def show():
+    render_page(*_render())
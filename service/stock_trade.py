@@ -7,7 +7,7 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from requests.sessions import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, func
 import streamlit as st
 from enums.category import Category
 from enums.history_type import StockHistoryType
@@ -15,7 +15,7 @@ from enums.signal import SignalType, SignalStrength
 from enums.strategy import StrategyType
 from models.stock import Stock
 from models.stock_history import get_history_model
-from models.stock_trade import StockTradeW, StockTrade30M, StockTradeM, StockTradeD, get_trade_model
+from models.stock_trade import get_trade_model
 from service.stock import reload, get_followed_codes, get_codes
 from service.stock_chart import show_detail_dialog
 from utils.convert import format_pattern_text
@@ -29,6 +29,46 @@ from utils.table import format_pinyin_short
 
 KEY_PREFIX = "stock_trade"
 
+# 上次成功写入信号时的历史数据指纹: (code, t) -> 指纹，只保存指纹不保存信号行
+# 指纹为区间内历史数据的 (最小日期, 最大日期, 条数, 收盘价之和, 成交量之和)，只依赖数据本身，
+# 不含 updated_at（历史同步 upsert 时会刷新）和日期区间（定时同步每天都不同）
+_history_fingerprints: Dict[tuple, tuple] = {}
+_history_fingerprints_lock = threading.Lock()
+
+
+def invalidate_history_fingerprint(code: str, t: StockHistoryType = None):
+    """清除指定股票(及周期)的历史数据指纹，下次更新时强制重新计算信号"""
+    with _history_fingerprints_lock:
+        for period in ([t] if t is not None else list(StockHistoryType)):
+            _history_fingerprints.pop((code, period), None)
+
+
+def _history_filters(model, code: str, start_date: Any, end_date: Any) -> List:
+    """构建历史数据查询条件，兼容字符串类型的日期"""
+    if isinstance(start_date, str) and start_date != '':
+        start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+    if isinstance(end_date, str) and end_date != '':
+        end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+    filters = [model.code == code]
+    if start_date is not None and start_date != '':
+        filters.append(model.date >= start_date)
+    if end_date is not None and end_date != '':
+        filters.append(model.date <= end_date)
+    return filters
+
+
+def _history_fingerprint(code: str, t: StockHistoryType, start_date: Any, end_date: Any) -> tuple:
+    """计算区间内历史数据的指纹"""
+    model = get_history_model(t)
+    with get_db_session() as session:
+        return tuple(session.query(
+            func.min(model.date),
+            func.max(model.date),
+            func.count(),
+            func.sum(model.closing),
+            func.sum(model.turnover_count)
+        ).filter(*_history_filters(model, code, start_date, end_date)).one())
+
 def show_detail(category: Category):
     t = st.radio(
         "选择时间周期",
@@ -107,6 +147,7 @@ def show_page(category: Category, t: StockHistoryType):
                     'strategy_type': lambda x: ', '.join([StrategyType.lookup(code.strip()).fullText for code in x.split(',')]) if x and ',' in x else ( StrategyType.lookup(x).fullText if x else ''),
                     'pattern_name': lambda x: x if x else '-'  # 形态名称，无形态时显示 -
                 },
+                categorical_columns=['signal_type', 'signal_strength', 'strategy_type'],
                 search_config=SearchConfig(
                     fields=[
                         SearchField(
@@ -116,7 +157,7 @@ def show_page(category: Category, t: StockHistoryType):
                             placeholder="输入股票代码/名称/简拼",
                             filter_func=lambda query, value: query.filter(
                                 or_(
-                                    model.code.ilike(f"%{value}%"),
+                                    Stock.code.ilike(f"%{value}%"),
                                     Stock.name.ilike(f"%{value}%"),
                                     Stock.pinyin.ilike(f"%{value}%")
                                 )
@@ -231,6 +272,17 @@ def reload_by_code(code: str, t: StockHistoryType, start_date: Any = None, end_d
         start_date = date.today() - timedelta(days=365)
     if end_date is None:
         end_date = date.today()
+    cache_key = (code, t)
+    if not ignore_message:
+        # 手动更新时强制重新计算信号
+        invalidate_history_fingerprint(code, t)
+    fingerprint = _history_fingerprint(code, t, start_date, end_date)
+    with _history_fingerprints_lock:
+        unchanged = _history_fingerprints.get(cache_key) == fingerprint
+    if unchanged:
+        # 历史数据未变化，已写入的信号仍然有效，跳过删除、信号计算和插入
+        logging.info(f"[{KEY_PREFIX}][{t.text}]历史数据未变化，跳过更新..., 股票:{code}")
+        return
     with get_db_session() as session:
         model = get_trade_model(t)
         session.query(model).filter(
@@ -239,7 +291,7 @@ def reload_by_code(code: str, t: StockHistoryType, start_date: Any = None, end_d
         session.commit()
     handler = _create_trade_handler(t)
     if ignore_message :
-        handler.refresh_ignore_message(
+        succeeded = handler.refresh_ignore_message(
             code=code,
             t=t,
             start_date=start_date,
@@ -247,13 +299,16 @@ def reload_by_code(code: str, t: StockHistoryType, start_date: Any = None, end_d
             limit=200,
         )
     else:
-        handler.refresh(
+        succeeded = handler.refresh(
             code=code,
             t=t,
             start_date=start_date,
             end_date=end_date,
             limit=200,
         )
+    if succeeded:
+        with _history_fingerprints_lock:
+            _history_fingerprints[cache_key] = fingerprint
 
 def _create_trade_handler(t: StockHistoryType):
     model = get_trade_model(t)
@@ -267,13 +322,15 @@ def _create_trade_handler(t: StockHistoryType):
         fetch_func=fetch,
         unique_fields=['code', 'date', 'strategy_type'],
         build_filter=build_filter,
-        with_date_range=False  # 我们已经在fetch_func中处理了日期范围
+        with_date_range=False,  # 我们已经在fetch_func中处理了日期范围
+        bulk_insert=True  # fetch 返回字典行，reload_by_code 已先删除旧数据
     )
 
-def fetch(code: str, t: StockHistoryType, start_date: Any = None, end_date: Any =  None, limit: int = 200) -> list:
+def fetch(code: str, t: StockHistoryType, start_date: Any = None, end_date: Any =  None, limit: int = 200) -> List[Dict[str, Any]]:
     logging.info(f"开始获取[{KEY_PREFIX}][{t.text}]数据..., 股票:{code}")
     # 获取历史数据模型类
     model = get_history_model(t)
+    filters = _history_filters(model, code, start_date, end_date)
     with get_db_session() as session:
         # 查询并直接提取需要的数据，避免保留模型实例引用
         query = session.query(
@@ -283,18 +340,7 @@ def fetch(code: str, t: StockHistoryType, start_date: Any = None, end_date: Any
             model.highest,
             model.lowest,
             model.turnover_count
-        ).filter(model.code == code)
-        if start_date is not None and start_date != '':
-            # 处理字符串类型的日期
-            if isinstance(start_date, str):
-                start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-            query = query.filter(model.date >= start_date)
-
-        if end_date is not None and end_date != '':
-            # 处理字符串类型的日期
-            if isinstance(end_date, str):
-                end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
-            query = query.filter(model.date <= end_date)
+        ).filter(*filters)
         #query = query.order_by(model.date.desc()).limit(limit)
         query = query.order_by(model.date.desc())
         rows = query.all()
@@ -316,59 +362,19 @@ def fetch(code: str, t: StockHistoryType, start_date: Any = None, end_date: Any
     # 计算信号
     signals = calculate_all_signals(df, merge_and_filter=True)
     logging.info(f"计算[{KEY_PREFIX}][{t.text}]数据的买卖信号完成..., 股票:{code}, 共{len(signals)}条")
-    # 转换为StockTrade对象
+    # 转换为 stock_trade 行数据（字典），由 reload handler 批量插入
     stock_trades = []
     for signal in signals:
-        signal_date = signal['date']
-        # 格式化模式文本
-        formatted_pattern = format_pattern_text(signal)
-
-        model_instance = None
-        if t == StockHistoryType.W:
-            model_instance = StockTradeW(
-                code=code,
-                category=category.value,
-                date=signal_date,
-                signal_type=signal['type'].value,
-                signal_strength=signal['strength'].value,
-                strategy_type=signal['strategy_code'],
-                pattern_name=formatted_pattern,
-                removed=False
-            )
-        elif t == StockHistoryType.M:
-            model_instance = StockTradeM(
-                code=code,
-                category=category.value,
-                date=signal_date,
-                signal_type=signal['type'].value,
-                signal_strength=signal['strength'].value,
-                strategy_type=signal['strategy_code'],
-                pattern_name=formatted_pattern,
-                removed=False
-            )
-        elif t == StockHistoryType.THIRTY_M:
-            model_instance = StockTrade30M(
-                code=code,
-                category=category.value,
-                date=signal_date,
-                signal_type=signal['type'].value,
-                signal_strength=signal['strength'].value,
-                strategy_type=signal['strategy_code'],
-                pattern_name=formatted_pattern,
-                removed=False
-            )
-        else:
-            model_instance = StockTradeD(
-                code=code,
-                category=category.value,
-                date=signal_date,
-                signal_type=signal['type'].value,
-                signal_strength=signal['strength'].value,
-                strategy_type=signal['strategy_code'],
-                pattern_name=formatted_pattern,
-                removed=False
-            )
-        stock_trades.append(model_instance)
+        stock_trades.append({
+            'code': code,
+            'category': category.value,
+            'date': signal['date'],
+            'signal_type': signal['type'].value,
+            'signal_strength': signal['strength'].value,
+            'strategy_type': signal['strategy_code'],
+            'pattern_name': format_pattern_text(signal),  # 格式化模式文本
+            'removed': False,
+        })
     return stock_trades
 
 
@@ -9,7 +9,7 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from sqlalchemy import inspect, insert, text
 from sqlalchemy.orm import Session
-from config.database import SessionLocal, Base
+from config.database import SessionLocal, Base, engine
 
 
 def upsert_objects(
@@ -102,6 +102,47 @@ def upsert_objects(
         logging.error(f"Upsert operation failed: {str(e)}")
         raise
 
+def insert_rows(
+        rows: List[Dict[str, Any]],
+        model: Type[Base],
+        unique_fields: List[str],  # 冲突判断的唯一字段
+        page_size: int = 1000,
+) -> Dict[str, int]:
+    """
+    通过原生 DBAPI 的 execute_values 批量插入字典行，冲突时忽略
+
+    适用于插入前已清理旧数据的场景（不做更新），比 ORM 逐批 upsert 快得多
+    返回的 processed 为实际插入的行数，因冲突被忽略的行不计入
+    """
+    from psycopg2.extras import execute_values
+
+    total = len(rows)
+    if total == 0:
+        return {'total': 0, 'processed': 0, 'failed': 0}
+    now = dt.now()
+    columns = [key for key in rows[0].keys() if key not in ('created_at', 'updated_at')]
+    values = [tuple(row.get(column) for column in columns) + (now, now) for row in rows]
+    columns += ['created_at', 'updated_at']
+    stmt = (f"INSERT INTO {model.__tablename__} ({', '.join(columns)}) VALUES %s "
+            f"ON CONFLICT ({', '.join(unique_fields)}) DO NOTHING RETURNING 1")
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        try:
+            # fetch=True 汇总各批 RETURNING 结果，冲突忽略的行不会返回
+            inserted = execute_values(cursor, stmt, values, page_size=page_size, fetch=True)
+        finally:
+            cursor.close()
+        conn.commit()
+        return {'total': total, 'processed': len(inserted), 'failed': 0}
+    except Exception as e:
+        conn.rollback()
+        logging.error(f"Insert rows failed: {str(e)}")
+        return {'total': total, 'processed': 0, 'failed': total}
+    finally:
+        conn.close()
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """获取数据库会话的上下文管理器"""
@@ -4,7 +4,7 @@ from typing import Callable, TypeVar, Generic, List, Any, Dict, Optional, Union
 import logging
 import streamlit as st
 from sqlalchemy.orm import Session
-from utils.db import get_db_session, upsert_objects
+from utils.db import get_db_session, upsert_objects, insert_rows
 from utils.message import show_message
 from utils.session import get_date_range
 
@@ -22,6 +22,7 @@ class ReloadConfig(Generic[T, D]):
     error_prefix: str = "处理失败"
     mark_existing: bool = False
     excluded_columns: List[str] = None
+    bulk_insert: bool = False  # fetch_func 返回字典行时，使用原生 execute_values 插入（冲突忽略）
 
 
 class ReloadHandler(Generic[T, D]):
@@ -51,6 +52,22 @@ class ReloadHandler(Generic[T, D]):
         if self.status_text:
             self.status_text.empty()
 
+    def save(self, data: List[D], session: Session, **upsert_options) -> Dict[str, int]:
+        """保存数据"""
+        if self.config.bulk_insert:
+            return insert_rows(
+                rows=data,
+                model=self.config.model,
+                unique_fields=self.config.unique_fields
+            )
+        return upsert_objects(
+            objects=data,
+            session=session,
+            model=self.config.model,
+            unique_fields=self.config.unique_fields,
+            **upsert_options
+        )
+
     def show_statistics(self, session: Session, filter_args: Dict[str, Any], result: Dict) -> None:
         """显示统计信息"""
         # 使用自定义过滤条件
@@ -109,13 +126,7 @@ class ReloadHandler(Generic[T, D]):
                 self.progress_bar = st.progress(0)
                 self.status_text = st.empty()
 
-                result = upsert_objects(
-                    objects=data,
-                    session=session,
-                    model=self.config.model,
-                    unique_fields=self.config.unique_fields,
-                    excluded_columns=self.config.excluded_columns
-                )
+                result = self.save(data, session, excluded_columns=self.config.excluded_columns)
                 self.progress_bar.progress(1.0)
                 self.status_text.text(
                     f"处理进度: {result['processed']}/{result['total']} "
@@ -134,11 +145,12 @@ class ReloadHandler(Generic[T, D]):
         finally:
             self.clear_displays()
 
-    def refresh_ignore_message(self, *args, **kwargs):
+    def refresh_ignore_message(self, *args, **kwargs) -> bool:
+        """刷新数据，不显示UI消息，返回是否全部保存成功（无数据视为成功）"""
         try:
             data = self.config.fetch_func(*args, **kwargs)
             if not data:
-                return None
+                return True
             with get_db_session() as session:
                 if self.config.mark_existing:
                     filter_conditions = self.config.build_filter(kwargs, session)
@@ -151,17 +163,11 @@ class ReloadHandler(Generic[T, D]):
                         'updated_at': datetime.now()
                     }, synchronize_session=False)  # 添加 synchronize_session=False
                     session.commit()
-                upsert_objects(
-                    objects=data,
-                    session=session,
-                    model=self.config.model,
-                    unique_fields=self.config.unique_fields,
-                    excluded_columns=self.config.excluded_columns
-                )
-                return None
+                result = self.save(data, session, excluded_columns=self.config.excluded_columns)
+                return result['failed'] == 0
         except Exception as e:
             logging.error(f"Refresh error: {str(e)}")
-            return None
+            return False
             
     def refresh_with_stats(self, *args, **kwargs) -> Dict[str, int]:
         """
@@ -189,13 +195,7 @@ class ReloadHandler(Generic[T, D]):
                     session.commit()
                     
                 # 调用 upsert_objects 获取详细统计信息
-                upsert_result = upsert_objects(
-                    objects=data,
-                    session=session,
-                    model=self.config.model,
-                    unique_fields=self.config.unique_fields,
-                    **kwargs.get('upsert_options', {})
-                )
+                upsert_result = self.save(data, session, **kwargs.get('upsert_options', {}))
                 
                 return {
                     "success_count": upsert_result['processed'],
@@ -246,6 +246,7 @@ def create_reload_handler(
         mark_existing: bool = False,
         with_date_range: bool = False,
         excluded_columns: List[str] = None,
+        bulk_insert: bool = False,
         **kwargs
 ) -> Union[ReloadHandler[T, D], DateRangeReloadHandler[T, D]]:
     config = ReloadConfig(
@@ -255,6 +256,7 @@ def create_reload_handler(
         build_filter=build_filter,
         mark_existing=mark_existing,
         excluded_columns=excluded_columns,
+        bulk_insert=bulk_insert,
         **kwargs
     )
     if with_date_range:
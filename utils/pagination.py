@@ -46,6 +46,34 @@ class ActionConfig:
     buttons: List[ActionButton]
     layout: List[int]  # 布局比例
 
+def _format_column(series: pd.Series, format_func: Callable, categorical: bool = False) -> pd.Series:
+    """格式化单列，categorical 为 True 时转为分类类型，格式化函数只对去重后的取值调用一次"""
+    if categorical and not series.isna().any():
+        series = series.astype('category')
+        mapping = {value: format_func(value) for value in series.cat.categories}
+        return series.map(mapping)
+    return series.apply(format_func)
+
+
+def _apply_format_funcs(df: pd.DataFrame, format_funcs: Dict, categorical_columns: Optional[List[str]] = None) -> None:
+    """应用格式化函数"""
+    categorical_set = set(categorical_columns or [])
+    for field, formats in format_funcs.items():
+        if field not in df.columns:
+            continue
+        categorical = field in categorical_set
+        if isinstance(formats, dict):
+            for format_key, format_func in formats.items():
+                if format_key != 'raw':  # 如果不是 raw，创建新列
+                    new_col = f"{field}_{format_key}"
+                    df[new_col] = _format_column(df[field], format_func, categorical)
+                else:  # 如果是 raw，处理原列
+                    df[field] = _format_column(df[field], format_func, categorical)
+        else:
+            # 处理普通的格式化函数
+            df[field] = _format_column(df[field], formats, categorical)
+
+
 class Pagination:
     def __init__(self, query: Query, page_size: int = 10, search_config: Optional[SearchConfig] = None):
         self.base_query = query
@@ -109,7 +137,8 @@ def paginate_dataframe(
         title: str = "",
         key_prefix: str = "",
         on_row_select: Optional[Callable] = None,
-        data: pd.DataFrame = None
+        data: pd.DataFrame = None,
+        categorical_columns: List[str] = None  # 重复取值较多的枚举列，转为分类类型后再格式化
 ) -> None:
     try:
         # 如果提供了 data 参数，直接展示数据，不需要查询和分页
@@ -135,18 +164,7 @@ def paginate_dataframe(
 
             # 应用格式化函数
             if format_funcs:
-                for field, formats in format_funcs.items():
-                    if field in df.columns:
-                        if isinstance(formats, dict):
-                            for format_key, format_func in formats.items():
-                                if format_key != 'raw':  # 如果不是 raw，创建新列
-                                    new_col = f"{field}_{format_key}"
-                                    df[new_col] = df[field].apply(format_func)
-                                else:  # 如果是 raw，处理原列
-                                    df[field] = df[field].apply(format_func)
-                        else:
-                            # 处理普通的格式化函数
-                            df[field] = df[field].apply(formats)
+                _apply_format_funcs(df, format_funcs, categorical_columns)
 
             # 如果提供了 columns_config，使用其键的顺序重排列
             if columns_config:
@@ -342,17 +360,7 @@ def paginate_dataframe(
 
             # 应用格式化函数
             if format_funcs:
-                for field, formats in format_funcs.items():
-                    if isinstance(formats, dict):
-                        for format_key, format_func in formats.items():
-                            if format_key != 'raw':  # 如果不是 raw，创建新列
-                                new_col = f"{field}_{format_key}"
-                                df[new_col] = df[field].apply(format_func)
-                            else:  # 如果是 raw，处理原列
-                                df[field] = df[field].apply(format_func)
-                    else:
-                        # 处理普通的格式化函数
-                        df[field] = df[field].apply(formats)
+                _apply_format_funcs(df, format_funcs, categorical_columns)
 
             # 如果提供了 columns_config，使用其键的顺序重排列
             if columns_config: